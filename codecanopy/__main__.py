@@ -0,0 +1,6 @@
+"""Entry point for ``python -m codecanopy``."""
+
+from .cli import main
+
+if __name__ == "__main__":
+    main()
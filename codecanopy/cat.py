@@ -1,109 +1,390 @@
 """Cat command implementation with comprehensive file handling and safety mechanisms."""
 
-import os
 import glob
-import fnmatch
+import io
+import mmap
+import os
+import re
+import stat
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Tuple, Set
+from typing import Iterator, List, Optional, Pattern, Tuple, Set
 
+import pathspec
+
+from . import textcache, uring_io
 from .config import Config
-from .utils import format_header, get_file_size, is_text_file
+from .utils import classify_by_extension, format_header, get_file_size, is_text_bytes
+
+
+def _read_whole_file(fd: int, size: int) -> bytes:
+    """Read an entire file from an open fd with a single read() syscall.
+
+    The buffered io layer would issue repeated 8 KiB reads plus a seek;
+    here the known fstat size is requested in one os.read. On platforms
+    with posix_fadvise the kernel is hinted for sequential access first,
+    widening its readahead window. A short read falls back to draining
+    the remainder in chunks.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    os.lseek(fd, 0, os.SEEK_SET)
+    data = os.read(fd, size) if size > 0 else b""
+    if len(data) >= size:
+        return data
+    parts = [data]
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        parts.append(chunk)
+    return b"".join(parts)
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one glob path segment to a regex fragment ('*'/'?' never cross '/')."""
+    pieces = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        if char == "*":
+            pieces.append("[^/]*")
+        elif char == "?":
+            pieces.append("[^/]")
+        elif char == "[":
+            # Copy character classes through mostly verbatim, like fnmatch does
+            j = i + 1
+            if j < len(segment) and segment[j] in "!^":
+                j += 1
+            if j < len(segment) and segment[j] == "]":
+                j += 1
+            while j < len(segment) and segment[j] != "]":
+                j += 1
+            if j >= len(segment):
+                pieces.append("\\[")
+            else:
+                stuff = segment[i + 1 : j].replace("\\", "\\\\")
+                if stuff.startswith("!"):
+                    stuff = "^" + stuff[1:]
+                pieces.append(f"[{stuff}]")
+                i = j
+        else:
+            pieces.append(re.escape(char))
+        i += 1
+    return "".join(pieces)
+
+
+def _translate_pattern(pattern: str) -> Pattern[str]:
+    """Compile a glob pattern to a regex over '/'-separated relative paths.
+
+    Unlike plain fnmatch, '*' and '?' never match across path separators;
+    '**' matches any number of intermediate directories (including none).
+    Like glob, wildcards never match a leading dot: hidden entries only
+    match pattern segments that themselves start with a literal '.'.
+    """
+    parts = pattern.replace("\\", "/").split("/")
+    pieces = []
+    for i, part in enumerate(parts):
+        is_last = i == len(parts) - 1
+        if part == "**":
+            # Trailing '**' matches everything below; otherwise zero or
+            # more dirs. Either way no traversed segment may be hidden.
+            if is_last:
+                pieces.append(r"(?!\.)[^/]*(?:/(?!\.)[^/]*)*")
+            else:
+                pieces.append(r"(?:(?!\.)[^/]+/)*")
+            continue
+        if not part.startswith("."):
+            pieces.append(r"(?!\.)")
+        pieces.append(_translate_segment(part))
+        if not is_last:
+            pieces.append("/")
+    return re.compile("".join(pieces) + r"\Z")
+
+
+def _split_pattern(pattern: str) -> Tuple[str, str]:
+    """Split a glob pattern into (literal prefix, wildcard suffix).
+
+    The prefix is the run of leading '/'-separated components free of
+    glob metacharacters; walking can be anchored there instead of at the
+    base directory. The suffix is empty for fully literal patterns.
+    """
+    parts = pattern.replace("\\", "/").split("/")
+    for i, part in enumerate(parts):
+        if _GLOB_MAGIC.intersection(part):
+            return "/".join(parts[:i]), "/".join(parts[i:])
+    return "/".join(parts), ""
+
+
+def _normalize_patterns(patterns: List[str]) -> List[str]:
+    """Collapse runs of '**/' segments and drop duplicate patterns.
+
+    Stacked globstars ("**/**/foo") make the compiled regexes backtrack
+    over the same separators repeatedly while matching no extra paths;
+    a single '**/' is equivalent. Order of the survivors is preserved.
+    """
+    seen = set()
+    normalized = []
+    for pattern in patterns:
+        pattern = re.sub(r"(\*\*/)+", "**/", pattern)
+        if pattern not in seen:
+            seen.add(pattern)
+            normalized.append(pattern)
+    return normalized
+
+
+def _walk(
+    base_path: Path,
+    exclude_spec=None,
+    rel_root=None,
+    max_depth=None,
+    include_hidden=False,
+) -> Iterator[Tuple[os.DirEntry, str]]:
+    """Yield (DirEntry, relative posix path) for every file under base_path.
+
+    Uses an explicit stack of os.scandir iterators so each directory is read
+    with a single getdents stream and the DirEntry type info is reused
+    instead of issuing an extra stat() per entry. Hidden entries are skipped
+    unless include_hidden is set: wildcards never match them anyway, so
+    listing them is only needed when some pattern segment names a dotfile
+    explicitly (the compiled regexes then enforce glob's leading-dot rule).
+    Directories matching exclude_spec are pruned outright, so excluded
+    subtrees are never even listed.
+
+    rel_root sets the directory relative paths are reported against; it
+    defaults to base_path but may be an ancestor when the walk is anchored
+    partway down a pattern's literal prefix. max_depth bounds how many
+    directory levels below base_path are entered (None means unbounded):
+    without a '**' in play, no pattern can match deeper than its own
+    segment count, so there is no point listing those directories.
+    """
+    base_len = len(str(rel_root if rel_root is not None else base_path)) + 1
+    stack = [(str(base_path), 0)]
+    while stack:
+        dir_path, depth = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if not include_hidden and entry.name.startswith("."):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if max_depth is not None and depth + 1 >= max_depth:
+                        continue
+                    if exclude_spec is not None and exclude_spec.match_file(
+                        entry.path[base_len:].replace(os.sep, "/") + "/"
+                    ):
+                        continue
+                    stack.append((entry.path, depth + 1))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry, entry.path[base_len:].replace(os.sep, "/")
+            except OSError:
+                continue
 
 
 def collect_files(patterns: List[str], exclude_patterns: List[str] = None, base_path: Path = None) -> List[Path]:
     """Collect files matching patterns, excluding those matching exclude patterns."""
+    return [path for path, _ in _collect_file_entries(patterns, exclude_patterns, base_path)]
+
+
+def _collect_file_entries(
+    patterns: List[str], exclude_patterns: List[str] = None, base_path: Path = None
+) -> List[Tuple[Path, Optional[int]]]:
+    """Collect matching files as (path, size) pairs.
+
+    Sizes come from the walk's DirEntry stat data where available
+    (None otherwise), letting callers skip a fresh stat per file.
+    """
     if base_path is None:
         base_path = Path.cwd()
-    
-    exclude_patterns = exclude_patterns or []
+    base_path = Path(base_path).resolve()
+
+    # Cleaning excludes up front keeps both the walk-time pruning spec
+    # and the post-filter spec small and free of redundant globstars
+    exclude_patterns = _normalize_patterns(exclude_patterns) if exclude_patterns else []
+
+    # Precompile include patterns once; one traversal per anchor serves
+    # all of them. Patterns without glob metacharacters are plain paths
+    # and get answered with a direct lookup instead of a directory walk.
     files = set()
-    
-    # Change to base directory for glob operations
-    original_cwd = Path.cwd()
-    try:
-        os.chdir(base_path)
-        
-        # Collect files matching include patterns
-        for pattern in patterns:
-            # Handle special case for current directory
-            if pattern == ".":
-                pattern = "*"
-            
+    sizes = {}
+    include_regexes = []
+    anchors = set()
+    include_hidden = False  # walk dot-entries only when a pattern names them
+    bounded_depth = 0  # deepest pattern segment count; None once '**' appears
+    for pattern in patterns:
+        # Handle special case for current directory
+        if pattern == ".":
+            pattern = "*"
+
+        if os.path.isabs(pattern) and _GLOB_MAGIC.intersection(pattern):
+            # Absolute wildcard patterns can't be matched against the
+            # base-relative paths the walk produces; answer them with
+            # glob from their own root instead
+            for match in glob.glob(pattern, recursive=True):
+                candidate = Path(match)
+                try:
+                    st = os.stat(candidate)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    files.add(candidate)
+                    sizes[candidate] = st.st_size
+            continue
+
+        if not _GLOB_MAGIC.intersection(pattern):
+            # One stat answers both existence and regular-file-ness, and
+            # its size is kept so no later check has to stat again.
+            # normpath collapses any '..' segments so headers and the
+            # exclude filter see the real base-relative path.
+            candidate = Path(os.path.normpath(base_path / pattern))
             try:
-                # Use glob.glob with recursive=True for ** patterns
-                matches = glob.glob(pattern, recursive=True)
-                
-                for match_str in matches:
-                    match_path = Path(match_str)
-                    if match_path.is_file():
-                        # Convert to absolute path relative to base_path
-                        abs_path = (base_path / match_path).resolve()
-                        files.add(abs_path)
-                        
-            except Exception as e:
-                # Skip invalid patterns gracefully
-                print(f"Warning: Could not process pattern '{pattern}': {e}")
+                st = os.stat(candidate)
+            except OSError:
                 continue
-        
-        # Filter out excluded files
+            if stat.S_ISREG(st.st_mode):
+                files.add(candidate)
+                sizes[candidate] = st.st_size
+            continue
+
+        try:
+            include_regexes.append(_translate_pattern(pattern))
+        except re.error as e:
+            # Skip invalid patterns gracefully
+            print(f"Warning: Could not process pattern '{pattern}': {e}")
+            continue
+        anchors.add(_split_pattern(pattern)[0])
+        if not include_hidden and any(
+            part.startswith(".") for part in pattern.replace("\\", "/").split("/")
+        ):
+            include_hidden = True
+        if bounded_depth is not None:
+            # '*' and '?' never cross '/', so a '**'-free pattern can only
+            # match at exactly its own segment count - no need to list
+            # directories any deeper than the deepest pattern
+            if "**" in pattern:
+                bounded_depth = None
+            else:
+                bounded_depth = max(bounded_depth, pattern.count("/") + 1)
+
+    if not include_regexes and not files:
+        return []
+
+    if include_regexes:
+        # Compile excludes once so whole subtrees (node_modules, .git, ...)
+        # can be pruned during the walk instead of filtered afterwards
+        exclude_spec = None
         if exclude_patterns:
-            files = _filter_excluded_files(files, exclude_patterns, base_path)
-        
-    finally:
-        # Always restore original working directory
-        os.chdir(original_cwd)
-    
-    return sorted(list(files))
+            try:
+                exclude_spec = pathspec.PathSpec.from_lines("gitwildmatch", exclude_patterns)
+            except Exception:
+                exclude_spec = None
+
+        # Walk from each pattern's literal prefix rather than base_path,
+        # so "src/**/*.py" never lists sibling trees. Anchors nested under
+        # another anchor are dropped; each kept root is walked once and
+        # matched against every include regex (relative paths are still
+        # reported against base_path, so the regexes apply unchanged).
+        roots = []
+        for anchor in sorted(anchors):
+            if not any(
+                root == "" or anchor == root or anchor.startswith(root + "/")
+                for root in roots
+            ):
+                roots.append(anchor)
+
+        for anchor in roots:
+            walk_root = base_path / anchor if anchor else base_path
+            if anchor and not walk_root.is_dir():
+                continue
+            anchor_depth = anchor.count("/") + 1 if anchor else 0
+            for entry, relative_str in _walk(
+                walk_root,
+                exclude_spec,
+                rel_root=base_path,
+                max_depth=(
+                    None if bounded_depth is None else bounded_depth - anchor_depth
+                ),
+                include_hidden=include_hidden,
+            ):
+                if any(regex.match(relative_str) for regex in include_regexes):
+                    path = Path(entry.path)
+                    files.add(path)
+                    try:
+                        sizes[path] = entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+
+    # Filter out excluded files
+    if exclude_patterns:
+        files = _filter_excluded_files(files, exclude_patterns, base_path)
+
+    return [(path, sizes.get(path)) for path in sorted(files)]
+
+
+_GLOB_MAGIC = frozenset("*?[")
+
+# Minimum batch size before per-file reads are dispatched to a thread pool
+_PARALLEL_THRESHOLD = 8
+
+# Whole-file reads above this size (bytes) go through mmap instead of read()
+_MMAP_THRESHOLD = 1_000_000
+
+# Headroom (bytes) allowed past the output cap before skipping the next file
+_OUTPUT_CAP_MARGIN = 4096
 
 
 def _filter_excluded_files(files: Set[Path], exclude_patterns: List[str], base_path: Path) -> Set[Path]:
     """Filter out files matching exclude patterns."""
-    excluded_files = set()
-    
+    # Literal patterns naming an existing directory become absolute prefixes
+    # checked with str.startswith; everything else is compiled into a single
+    # gitwildmatch PathSpec so each file is matched exactly once
+    literal_dir_prefixes = []
+    spec_lines = []
     for exclude_pattern in exclude_patterns:
+        if not _GLOB_MAGIC.intersection(exclude_pattern):
+            candidate = base_path / exclude_pattern.rstrip("/")
+            if candidate.is_dir():
+                literal_dir_prefixes.append(str(candidate) + os.sep)
+                continue
+        spec_lines.append(exclude_pattern)
+
+    spec = None
+    if spec_lines:
         try:
-            # Get all paths matching the exclude pattern
-            exclude_matches = glob.glob(exclude_pattern, recursive=True)
-            
-            for exclude_match_str in exclude_matches:
-                exclude_path = (base_path / exclude_match_str).resolve()
-                
-                if exclude_path.is_file():
-                    excluded_files.add(exclude_path)
-                elif exclude_path.is_dir():
-                    # Exclude all files within the directory
-                    for file_path in files.copy():
-                        try:
-                            # Check if file is within excluded directory
-                            file_path.relative_to(exclude_path)
-                            excluded_files.add(file_path)
-                        except ValueError:
-                            # file_path is not within exclude_path, skip
-                            continue
-            
-            # Also handle exclude patterns that match files directly
-            for file_path in files.copy():
-                try:
-                    # Convert absolute path back to relative for pattern matching
-                    relative_path = file_path.relative_to(base_path)
-                    relative_str = str(relative_path).replace('\\', '/')  # Normalize separators
-                    
-                    # Use fnmatch for shell-style pattern matching
-                    if fnmatch.fnmatch(relative_str, exclude_pattern):
-                        excluded_files.add(file_path)
-                    # Also check just the filename
-                    elif fnmatch.fnmatch(relative_path.name, exclude_pattern):
-                        excluded_files.add(file_path)
-                        
-                except ValueError:
-                    # file_path is not relative to base_path, skip
-                    continue
-                    
+            spec = pathspec.PathSpec.from_lines("gitwildmatch", spec_lines)
         except Exception as e:
-            print(f"Warning: Could not process exclude pattern '{exclude_pattern}': {e}")
+            print(f"Warning: Could not process exclude patterns {spec_lines}: {e}")
+
+    # Single pass retaining survivors directly: no intermediate excluded
+    # set and no final set-difference allocation
+    kept_files = set()
+    for file_path in files:
+        path_str = str(file_path)
+        if any(path_str.startswith(prefix) for prefix in literal_dir_prefixes):
             continue
-    
-    return files - excluded_files
+
+        if spec is not None:
+            try:
+                relative_parts = file_path.relative_to(base_path).parts
+            except ValueError:
+                # file_path is not relative to base_path; keep it
+                kept_files.add(file_path)
+                continue
+            if spec.match_file("/".join(relative_parts)):
+                continue
+
+        kept_files.add(file_path)
+
+    return kept_files
 
 
 class CatGenerator:
@@ -123,8 +404,77 @@ class CatGenerator:
         max_output: str = None,
         truncate_mode: str = "head",
         base_path: Path = None,
+        io_backend: str = "auto",
     ) -> str:
         """Generate concatenated file contents with safety limits and truncation."""
+        return "\n".join(
+            self._iter_lines(
+                patterns,
+                exclude_patterns=exclude_patterns,
+                header_format=header_format,
+                show_headers=show_headers,
+                max_file_size=max_file_size,
+                max_lines=max_lines,
+                max_output=max_output,
+                truncate_mode=truncate_mode,
+                base_path=base_path,
+                io_backend=io_backend,
+            )
+        )
+
+    def generate_bytes(self, patterns: List[str], **kwargs) -> bytes:
+        """Generate output as UTF-8 bytes; accepts the same arguments as generate().
+
+        Thin accumulator over iter_chunks for callers that want the
+        whole output in memory as bytes without a whole-output str in
+        between; the CLI streams iter_chunks directly instead. Chunks
+        land in one growable bytearray (amortized doubling, no final
+        join pass).
+        """
+        buf = bytearray()
+        for chunk in self.iter_chunks(patterns, **kwargs):
+            buf += chunk
+        return bytes(buf)
+
+    def iter_chunks(self, patterns: List[str], **kwargs) -> Iterator[bytes]:
+        """Stream the output as encoded chunks; same arguments as generate().
+
+        Chunks come out as each file is merged, so a consumer (shell
+        pipe, pager) starts seeing output before every file has been
+        read and nothing ever holds the whole result in memory. Each
+        chunk carries its leading newline separator.
+        """
+        first = True
+        for line in self._iter_lines(patterns, **kwargs):
+            data = line.encode("utf-8", errors="replace")
+            if first:
+                first = False
+                yield data
+            else:
+                yield b"\n" + data
+
+    def _iter_lines(
+        self,
+        patterns: List[str],
+        exclude_patterns: List[str] = None,
+        header_format: str = None,
+        show_headers: bool = True,
+        max_file_size: str = None,
+        max_lines: int = None,
+        max_output: str = None,
+        truncate_mode: str = "head",
+        base_path: Path = None,
+        io_backend: str = "auto",
+    ) -> Iterator[str]:
+        """Yield the output line fragments (without trailing newlines).
+
+        Fragments stream out as files are merged; on the serial path a
+        file is not even read until its predecessors have been yielded.
+        io_backend selects the read strategy: "uring" forces the io_uring
+        preload (falling back if unavailable), "threads" forces the thread
+        pool, "sync" keeps everything sequential, and "auto" (default)
+        picks per batch size.
+        """
 
         if base_path is None:
             base_path = Path.cwd()
@@ -153,85 +503,139 @@ class CatGenerator:
         # Get default max_lines from config
         max_lines = max_lines or self.config.get("max_lines", None)
 
-        # Collect files using the improved glob-based function
+        # Collect files using the improved glob-based function; entries
+        # carry sizes straight from the walk's DirEntry stat data, so no
+        # fresh stat is needed for size checks below
         try:
-            files = collect_files(patterns, exclude_patterns, base_path)
+            entries = _collect_file_entries(patterns, exclude_patterns, base_path)
         except Exception as e:
-            return f"Error collecting files: {e}"
+            yield f"Error collecting files: {e}"
+            return
+        files = [path for path, _ in entries]
 
         if not files:
-            return "No files found matching the specified patterns."
+            yield "No files found matching the specified patterns."
+            return
+
+        # On Linux with liburing available, batch all file reads through
+        # io_uring up front instead of one blocking round-trip per file
+        preloaded = None
+        want_uring = io_backend == "uring" or (
+            io_backend == "auto" and len(files) >= 16
+        )
+        if want_uring and uring_io.available():
+            try:
+                preloaded = uring_io.read_files(
+                    files,
+                    max_bytes=None if max_size_bytes == float("inf") else max_size_bytes,
+                )
+            except (RuntimeError, OSError):
+                preloaded = None
+
+        # Precompute the base prefix once; format_header then relativizes
+        # each path with plain string slicing instead of Path.relative_to
+        base_str = str(Path(base_path).resolve()) + os.sep
 
         # Process files with safety limits
-        output_lines = []
         processed_count = 0
         total_output_size = 0
         skipped_files = {"binary": 0, "too_large": 0, "errors": 0}
 
-        for file_path in files:
-            try:
-                # Check if we've exceeded total output limit
-                if total_output_size > max_output_bytes:
-                    output_lines.append(f"\n[Output limit exceeded ({self._format_size(max_output_bytes)}), stopping...]")
+        def process(entry):
+            file_path, known_size = entry
+            return self._process_file(
+                file_path,
+                preloaded.get(file_path) if preloaded is not None else None,
+                show_headers,
+                header_format,
+                base_str,
+                max_size_bytes,
+                max_lines,
+                truncate_mode,
+                known_size=known_size,
+            )
+
+        # File reads release the GIL, so a thread pool overlaps the per-file
+        # disk latency. Small batches stay serial (and lazy, so the output
+        # cap below still stops further reads) to skip pool startup cost.
+        results = None
+        want_threads = io_backend == "threads" or (
+            io_backend != "sync" and len(files) >= _PARALLEL_THRESHOLD
+        )
+        if want_threads:
+            with ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4)
+            ) as executor:
+                results = list(executor.map(process, entries))
+
+        # Merge per-file results in input order so output is deterministic.
+        # Lines buffer only until the first file processes successfully:
+        # if every file ends up skipped, the per-file markers are replaced
+        # by one message, matching the pre-streaming behavior. A trailing
+        # "" separator is withheld until more output follows, so the
+        # output never ends in a blank line.
+        have_output_cap = max_output_bytes != float("inf")
+        pending = []
+        streaming = False
+        held_blank = False
+        cap_stop = None
+
+        def drain(produced):
+            nonlocal held_blank
+            for line in produced:
+                if held_blank:
+                    held_blank = False
+                    yield ""
+                if line == "":
+                    held_blank = True
+                else:
+                    yield line
+
+        for i, (file_path, known_size) in enumerate(entries):
+            # Check if we've exceeded total output limit
+            if total_output_size > max_output_bytes:
+                cap_stop = f"\n[Output limit exceeded ({self._format_size(max_output_bytes)}), stopping...]"
+                break
+
+            # On the serial path, the known size (or a cheap stat) up front
+            # avoids reading a file in full only to have the cap check
+            # discard it afterwards. Files the size cap or a known-binary
+            # extension would skip contribute no output, so they must not
+            # trip the guard - they fall through and are skipped as usual.
+            if results is None and have_output_cap:
+                remaining = max_output_bytes - total_output_size
+                next_size = known_size if known_size is not None else get_file_size(file_path)
+                if (
+                    next_size > remaining + _OUTPUT_CAP_MARGIN
+                    and next_size <= max_size_bytes
+                    and classify_by_extension(file_path.name) is not False
+                ):
+                    cap_stop = "\n[Output limit would be exceeded by next file, stopping...]"
                     break
 
-                # Check file size
-                file_size = get_file_size(file_path)
-                if file_size > max_size_bytes:
-                    if show_headers:
-                        header = format_header(header_format, file_path, base_path)
-                        output_lines.append(header)
-                    output_lines.append(f"[File too large: {self._format_size(file_size)}, skipped]")
-                    output_lines.append("")
-                    skipped_files["too_large"] += 1
-                    continue
-
-                # Check if file is text
-                if not is_text_file(file_path):
-                    if show_headers:
-                        header = format_header(header_format, file_path, base_path)
-                        output_lines.append(header)
-                    output_lines.append("[Binary file, skipped]")
-                    output_lines.append("")
-                    skipped_files["binary"] += 1
-                    continue
-
-                # Add header
-                if show_headers:
-                    header = format_header(header_format, file_path, base_path)
-                    output_lines.append(header)
-
-                # Add file content with smart truncation
-                try:
-                    content, was_truncated = self._read_file_content(
-                        file_path, max_lines, truncate_mode
-                    )
-                    
-                    if content:
-                        output_lines.append(content)
-                        if was_truncated:
-                            truncation_info = self._get_truncation_info(file_path, max_lines, truncate_mode)
-                            output_lines.append(f"[{truncation_info}]")
-                        
-                        processed_count += 1
-                        
-                        # Track output size (rough estimate)
-                        total_output_size += len(content.encode('utf-8'))
-                    else:
-                        output_lines.append("[Empty file]")
-                        processed_count += 1
-                    
-                except (IOError, OSError, UnicodeDecodeError) as e:
-                    output_lines.append(f"[Error reading file: {e}]")
-                    skipped_files["errors"] += 1
-
-                # Add separator between files (but not after the last file)
-                output_lines.append("")
+            lines, status, content_size = (
+                results[i] if results is not None else process(entries[i])
+            )
+            total_output_size += content_size
+            if status in ("ok", "empty"):
+                processed_count += 1
+            else:
+                skipped_files[status] += 1
 
-            except Exception as e:
-                output_lines.append(f"[Error processing {file_path}: {e}]")
-                output_lines.append("")
-                skipped_files["errors"] += 1
+            if streaming:
+                yield from drain(lines)
+            else:
+                pending.extend(lines)
+                if processed_count:
+                    streaming = True
+                    yield from drain(pending)
+                    pending = []
+
+        # The cap-stop notice is not a per-file skip marker: it is
+        # yielded here after the loop (nothing can follow it) so the
+        # all-skipped replacement below can't swallow it
+        if cap_stop is not None and streaming:
+            yield from drain([cap_stop])
 
         # Generate summary
         if processed_count == 0:
@@ -242,15 +646,15 @@ class CatGenerator:
                 reasons.append(f"{skipped_files['too_large']} too large")
             if skipped_files["errors"] > 0:
                 reasons.append(f"{skipped_files['errors']} errors")
-            
-            reason_str = ", ".join(reasons) if reasons else "unknown reasons"
-            return f"No files could be processed (skipped: {reason_str})."
 
-        # Remove the last empty line if present
-        if output_lines and output_lines[-1] == "":
-            output_lines.pop()
+            reason_str = ", ".join(reasons) if reasons else "unknown reasons"
+            yield f"No files could be processed (skipped: {reason_str})."
+            if cap_stop is not None:
+                yield cap_stop
+            return
 
-        # Add summary if files were skipped
+        # Add summary if files were skipped (the withheld trailing blank
+        # line is simply dropped, and the summary brings its own)
         if any(skipped_files.values()):
             total_skipped = sum(skipped_files.values())
             summary_parts = []
@@ -260,65 +664,240 @@ class CatGenerator:
                 summary_parts.append(f"{skipped_files['too_large']} too large")
             if skipped_files["errors"] > 0:
                 summary_parts.append(f"{skipped_files['errors']} errors")
-            
-            summary = f"Processed {processed_count} files, skipped {total_skipped} ({', '.join(summary_parts)})"
-            output_lines.append("")
-            output_lines.append(f"[{summary}]")
 
-        return "\n".join(output_lines)
+            summary = f"Processed {processed_count} files, skipped {total_skipped} ({', '.join(summary_parts)})"
+            yield ""
+            yield f"[{summary}]"
 
-    def _read_file_content(self, file_path: Path, max_lines: int = None, truncate_mode: str = "head") -> Tuple[str, bool]:
-        """Read file content with smart truncation options."""
+    def _process_file(
+        self,
+        file_path: Path,
+        pre,
+        show_headers: bool,
+        header_format: str,
+        base_str: str,
+        max_size_bytes,
+        max_lines: Optional[int],
+        truncate_mode: str,
+        known_size: Optional[int] = None,
+    ) -> Tuple[List[str], str, int]:
+        """Classify and read a single file, returning its output lines.
+
+        Returns (lines, status, content_size) where status is one of
+        "ok", "empty", "binary", "too_large" or "errors". known_size is
+        the walk-time stat size when available; oversized files are then
+        skipped without even being opened. Safe to call from worker
+        threads: it touches no generator state.
+        """
+        lines = []
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                if max_lines is None:
-                    content = f.read().rstrip()
-                    return content, False
-                
-                lines = f.readlines()
-                total_lines = len(lines)
-                
-                if total_lines <= max_lines:
-                    content = ''.join(lines).rstrip()
-                    return content, False
-                
-                # Apply truncation based on mode
-                if truncate_mode == "head":
-                    selected_lines = lines[:max_lines]
-                elif truncate_mode == "tail":
-                    selected_lines = lines[-max_lines:]
-                elif truncate_mode == "middle":
-                    # Show half from start, half from end with separator
-                    half = max_lines // 2
-                    remaining = max_lines - half
-                    separator = ["...\n[middle content omitted]\n...\n"]
-                    selected_lines = lines[:half] + separator + lines[-remaining:]
+            header = (
+                format_header(header_format, file_path, base_str=base_str)
+                if show_headers
+                else None
+            )
+
+            if pre is not None and pre.error is not None:
+                if header is not None:
+                    lines.append(header)
+                lines.append(f"[Error reading file: {pre.error}]")
+                lines.append("")
+                return lines, "errors", 0
+
+            # Oversized files are skipped silently (the summary still
+            # counts them); emitting their header would leak the very
+            # content the size cap is meant to keep out of the context
+            if (
+                pre is None
+                and known_size is not None
+                and known_size > max_size_bytes
+            ):
+                return lines, "too_large", 0
+
+            # Unambiguous extensions settle the text/binary question in
+            # O(1); known-binary files whose size already passed (or is
+            # uncapped) are skipped without ever being opened
+            ext_verdict = classify_by_extension(file_path.name)
+            if (
+                pre is None
+                and ext_verdict is False
+                and (known_size is not None or max_size_bytes == float("inf"))
+            ):
+                if header is not None:
+                    lines.append(header)
+                lines.append("[Binary file, skipped]")
+                lines.append("")
+                return lines, "binary", 0
+
+            # Open once: the same fd serves the size check (fstat), the
+            # text/binary probe, and the content read. Preloaded files
+            # skip the filesystem entirely and read from memory.
+            file_stat = None
+            if pre is not None:
+                file_size = pre.size
+                raw = io.BytesIO(pre.data if pre.data is not None else b"")
+            else:
+                try:
+                    raw = open(file_path, "rb")
+                except (IOError, OSError) as e:
+                    if header is not None:
+                        lines.append(header)
+                    lines.append(f"[Error reading file: {e}]")
+                    lines.append("")
+                    return lines, "errors", 0
+                file_stat = os.fstat(raw.fileno())
+                file_size = file_stat.st_size
+
+            with raw:
+                # Check file size (silent skip, as above)
+                if file_size > max_size_bytes:
+                    return lines, "too_large", 0
+
+                # Check if file is text; extension verdicts skip the probe
+                # outright, and the persistent cache remembers scanned
+                # verdicts per (path, mtime, size) so repeat runs skip the
+                # probe read and byte scan
+                if ext_verdict is not None:
+                    is_text = ext_verdict
+                elif file_stat is not None:
+                    cache = textcache.get_default_cache()
+                    is_text = cache.get(
+                        str(file_path), file_stat.st_mtime_ns, file_size
+                    )
+                    if is_text is None:
+                        is_text = is_text_bytes(raw.read(8192))
+                        cache.put(
+                            str(file_path), file_stat.st_mtime_ns, file_size, is_text
+                        )
                 else:
-                    # Default to head if invalid mode
-                    selected_lines = lines[:max_lines]
-                
-                content = ''.join(selected_lines).rstrip()
-                return content, True
-                
-        except Exception as e:
-            return f"[Error reading file: {e}]", False
+                    is_text = is_text_bytes(raw.read(8192))
+
+                if not is_text:
+                    if header is not None:
+                        lines.append(header)
+                    lines.append("[Binary file, skipped]")
+                    lines.append("")
+                    return lines, "binary", 0
+
+                if header is not None:
+                    lines.append(header)
+
+                # Add file content with smart truncation
+                try:
+                    if max_lines is None:
+                        # Whole-file read: grab the raw bytes in one shot and
+                        # decode once, instead of pushing every byte through
+                        # the buffered text layer's incremental decoder
+                        if pre is not None:
+                            data = pre.data if pre.data is not None else b""
+                        elif file_size > _MMAP_THRESHOLD:
+                            # Large files: map and slice instead of a copy
+                            # through the read buffer
+                            with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                                data = mm[:]
+                        else:
+                            data = _read_whole_file(raw.fileno(), file_size)
+                        content = data.decode("utf-8", errors="ignore").rstrip()
+                        was_truncated, total_lines = False, None
+                    else:
+                        raw.seek(0)
+                        text_stream = io.TextIOWrapper(raw, encoding="utf-8", errors="ignore")
+                        content, was_truncated, total_lines = self._read_file_content(
+                            text_stream, max_lines, truncate_mode
+                        )
+                except (IOError, OSError, UnicodeDecodeError, ValueError) as e:
+                    lines.append(f"[Error reading file: {e}]")
+                    lines.append("")
+                    return lines, "errors", 0
+
+            if content:
+                lines.append(content)
+                if was_truncated:
+                    truncation_info = self._get_truncation_info(total_lines, max_lines, truncate_mode)
+                    lines.append(f"[{truncation_info}]")
+                lines.append("")
+                # Track output size (rough estimate): the on-disk size is
+                # already known from fstat, so no throwaway re-encode of the
+                # content is needed; truncated output falls back to the
+                # character count
+                content_size = file_size if not was_truncated else len(content)
+                return lines, "ok", content_size
+
+            lines.append("[Empty file]")
+            lines.append("")
+            return lines, "empty", 0
 
-    def _get_truncation_info(self, file_path: Path, max_lines: int, truncate_mode: str) -> str:
-        """Get truncation information message."""
+        except Exception as e:
+            lines.append(f"[Error processing {file_path}: {e}]")
+            lines.append("")
+            return lines, "errors", 0
+
+    def _read_file_content(
+        self, f, max_lines: int = None, truncate_mode: str = "head"
+    ) -> Tuple[str, bool, Optional[int]]:
+        """Read content from an open text stream with smart truncation options.
+
+        Returns (content, was_truncated, total_lines); total_lines is None
+        when the file was not read line-by-line.
+        """
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                total_lines = sum(1 for _ in f)
-            
-            if truncate_mode == "head":
-                return f"Truncated: showing first {max_lines} of {total_lines} lines"
-            elif truncate_mode == "tail":
-                return f"Truncated: showing last {max_lines} of {total_lines} lines"
-            elif truncate_mode == "middle":
-                return f"Truncated: showing first/last {max_lines} of {total_lines} lines"
-            else:
-                return f"Truncated: showing {max_lines} of {total_lines} lines"
-        except:
-            return f"Truncated: showing {max_lines} lines"
+            if max_lines is None:
+                content = f.read().rstrip()
+                return content, False, None
+
+            if truncate_mode == "tail":
+                # One pass with a bounded deque: O(max_lines) memory,
+                # and the enumerate gives the total for free
+                selected_lines = deque(maxlen=max_lines)
+                total_lines = 0
+                for total_lines, line in enumerate(f, 1):
+                    selected_lines.append(line)
+                was_truncated = total_lines > max_lines
+                content = ''.join(selected_lines).rstrip()
+                return content, was_truncated, total_lines
+
+            if truncate_mode == "middle":
+                # Show half from start, half from end with separator
+                half = max_lines // 2
+                remaining = max_lines - half
+                head_lines = list(islice(f, half))
+                tail_lines = deque(maxlen=remaining)
+                rest_count = 0
+                for rest_count, line in enumerate(f, 1):
+                    tail_lines.append(line)
+                total_lines = len(head_lines) + rest_count
+                if rest_count <= remaining:
+                    content = ''.join(head_lines) + ''.join(tail_lines)
+                    return content.rstrip(), False, total_lines
+                separator = "...\n[middle content omitted]\n...\n"
+                content = ''.join(head_lines) + separator + ''.join(tail_lines)
+                return content.rstrip(), True, total_lines
+
+            # Default mode "head": stop reading after max_lines instead
+            # of materializing the whole file with readlines()
+            head_lines = list(islice(f, max_lines))
+            was_truncated = bool(f.readline())
+            total_lines = None if was_truncated else len(head_lines)
+            content = ''.join(head_lines).rstrip()
+            return content, was_truncated, total_lines
+
+        except Exception as e:
+            return f"[Error reading file: {e}]", False, None
+
+    def _get_truncation_info(self, total_lines: Optional[int], max_lines: int, truncate_mode: str) -> str:
+        """Format the truncation message from an already-known line count."""
+        if total_lines is None:
+            # Head mode stops reading at the limit, so the total is unknown
+            return f"Truncated: showing first {max_lines} lines"
+
+        if truncate_mode == "head":
+            return f"Truncated: showing first {max_lines} of {total_lines} lines"
+        elif truncate_mode == "tail":
+            return f"Truncated: showing last {max_lines} of {total_lines} lines"
+        elif truncate_mode == "middle":
+            return f"Truncated: showing first/last {max_lines} of {total_lines} lines"
+        else:
+            return f"Truncated: showing {max_lines} of {total_lines} lines"
 
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format."""
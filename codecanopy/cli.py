@@ -9,6 +9,18 @@ from .tree import TreeGenerator
 from .cat import CatGenerator
 
 
+def _split_multi(values):
+    """Expand repeated options whose values may be comma-separated lists.
+
+    README examples use both forms: --focus src --focus lib and
+    --focus src,lib.
+    """
+    items = []
+    for value in values:
+        items.extend(part.strip() for part in value.split(",") if part.strip())
+    return items
+
+
 @click.group(invoke_without_command=True)
 @click.pass_context
 def main(ctx):
@@ -25,18 +37,19 @@ def main(ctx):
 @click.option(
     "--focus",
     multiple=True,
-    help="Focus directories (full depth). Can be used multiple times.",
+    help="Focus directories (full depth). Comma-separated or repeated.",
 )
 @click.option(
     "--ignore",
     multiple=True,
-    help="Ignore directories/files. Can be used multiple times.",
+    help="Ignore directories/files. Comma-separated or repeated.",
 )
 @click.option("--depth", type=int, help="Global depth limit (default: 3)")
+@click.option("--files", "show_files", is_flag=True, help="Show files (the default)")
 @click.option("--no-files", is_flag=True, help="Hide files, show only directories")
 @click.option("--config", help="Config file path (default: .codecanopy.json)")
 @click.argument("path", required=False, default=".")
-def tree(focus, ignore, depth, no_files, config, path):
+def tree(focus, ignore, depth, show_files, no_files, config, path):
     """Show directory structure with selective depth control.
 
     PATH: Directory to analyze (default: current directory)
@@ -63,15 +76,15 @@ def tree(focus, ignore, depth, no_files, config, path):
         # Generate tree
         generator = TreeGenerator(cfg)
 
-        ignore_patterns = list(ignore) if ignore else None
-        focus_dirs = list(focus) if focus else None
+        ignore_patterns = _split_multi(ignore) if ignore else None
+        focus_dirs = _split_multi(focus) if focus else None
 
         result = generator.generate(
             root_path=root_path,
             focus_dirs=focus_dirs,
             ignore_patterns=ignore_patterns,
             global_depth=depth,
-            show_files=not no_files,
+            show_files=show_files or not no_files,
         )
 
         click.echo(result)
@@ -116,39 +129,40 @@ def tree(focus, ignore, depth, no_files, config, path):
     default="head",
     help="How to truncate large files (default: head)"
 )
-@click.option("--config", help="Config file path (default: .codecanopy.json)")
-@click.argument(
-    "base_path",
-    type=click.Path(
-        exists=True,       # Must exist
-        file_okay=False,   # Don't allow files
-        dir_okay=True,     # Allow directories only
-        readable=True,     # Must be readable
-        resolve_path=True, # Convert to absolute path
-        path_type=Path,    # Return as pathlib.Path object
-    ),
-    default=".",
-    required=False,
+@click.option(
+    "--io-backend",
+    type=click.Choice(["auto", "uring", "threads", "sync"]),
+    default="auto",
+    help="File read strategy (default: auto picks per batch size)",
 )
-def cat(patterns, exclude, no_ignore, header, no_headers, max_size, max_lines, max_output, truncate_mode, config, base_path):
+@click.option("--config", help="Config file path (default: .codecanopy.json)")
+def cat(patterns, exclude, no_ignore, header, no_headers, max_size, max_lines, max_output, truncate_mode, io_backend, config):
     """Show file contents with headers.
 
-    PATTERNS: File patterns to include (supports glob patterns). 
+    PATTERNS: File patterns to include (supports glob patterns).
+              If the first argument is an existing directory it is used
+              as the base path to search in (default: current directory).
               If no patterns provided, defaults to all files recursively.
-    BASE_PATH: Directory to search in (defaults to current directory).
 
     Examples:
       codecanopy cat                        # Show all files in current directory
       codecanopy cat /path/to/project       # Show all files in specified directory
       codecanopy cat . "src/**/*.py"        # Show Python files in src/
       codecanopy cat /project "*.js" "*.ts" # Show JS/TS files in /project
+      codecanopy cat "src/**/*.js"          # Show JS files under src/
       codecanopy cat . "**/*" --exclude "*test*"  # All files, exclude tests
     """
 
     try:
-        # base_path is now automatically validated and converted by Click
-        # No need for manual validation since Click handles it
-        
+        # A leading directory argument is the base path; everything else
+        # is a pattern. This keeps both documented forms working:
+        # "cat /project '*.js'" and "cat 'src/**/*.js'".
+        patterns = list(patterns)
+        if patterns and Path(patterns[0]).is_dir():
+            base_path = Path(patterns.pop(0)).resolve()
+        else:
+            base_path = Path(".").resolve()
+
         # Load configuration
         cfg = Config(config)
 
@@ -169,8 +183,11 @@ def cat(patterns, exclude, no_ignore, header, no_headers, max_size, max_lines, m
         # Generate output
         generator = CatGenerator(cfg)
 
-        result = generator.generate(
-            patterns=list(patterns),
+        # Streaming bytes path: chunks hit stdout as files are merged, so
+        # pipes start consuming before every file has been read and the
+        # whole output is never held in memory
+        for chunk in generator.iter_chunks(
+            patterns,
             exclude_patterns=exclude_patterns,
             header_format=header,
             show_headers=not no_headers,
@@ -179,9 +196,10 @@ def cat(patterns, exclude, no_ignore, header, no_headers, max_size, max_lines, m
             max_output=max_output,
             truncate_mode=truncate_mode,
             base_path=base_path,
-        )
-
-        click.echo(result)
+            io_backend=io_backend,
+        ):
+            click.echo(chunk, nl=False)
+        click.echo()
 
     except KeyboardInterrupt:
         click.echo("\nOperation cancelled.", err=True)
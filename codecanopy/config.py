@@ -1,11 +1,59 @@
 """Configuration handling for CodeCanopy."""
 
+import functools
 import json
 import os
-import re
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+_SIZE_MULTIPLIERS = {
+    "B": 1,
+    "K": 1024,
+    "KB": 1024,
+    "M": 1024 * 1024,
+    "MB": 1024 * 1024,
+    "G": 1024 * 1024 * 1024,
+    "GB": 1024 * 1024 * 1024,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_size_str(size_str: str) -> int:
+    """Parse a non-empty size string like '100KB' to bytes, memoized.
+
+    Config and CLI size values are few and repeat across calls, so the
+    cache turns repeat parses into a dict lookup.
+    """
+    size_str = size_str.strip().upper()
+
+    if not size_str:
+        return float("inf")
+
+    # Handle pure numbers (assume bytes)
+    if size_str.isdigit():
+        return int(size_str)
+
+    # Units are a tiny closed set, so a suffix switch beats a regex:
+    # peel the unit off the end, then validate the numeric part as
+    # digits with at most one interior dot
+    if size_str.endswith(("KB", "MB", "GB")):
+        unit, number_str = size_str[-2:], size_str[:-2]
+    elif size_str[-1] in "KMGB":
+        unit, number_str = size_str[-1], size_str[:-1]
+    else:
+        unit, number_str = "B", size_str
+
+    number_str = number_str.strip()
+    if (
+        number_str
+        and number_str[0].isdigit()
+        and number_str[-1].isdigit()
+        and number_str.replace(".", "", 1).isdigit()
+    ):
+        return int(float(number_str) * _SIZE_MULTIPLIERS[unit])
+
+    return float("inf")
+
 
 class Config:
     """Configuration management for CodeCanopy."""
@@ -71,33 +119,4 @@ class Config:
         if not isinstance(size_str, str):
             return float("inf")
 
-        # Remove whitespace and convert to uppercase
-        size_str = size_str.strip().upper()
-
-        if not size_str:
-            return float("inf")
-
-        # Handle pure numbers (assume bytes)
-        if size_str.isdigit():
-            return int(size_str)
-
-        # Parse size with unit
-        match = re.match(r"^(\d+(?:\.\d+)?)\s*(KB|MB|GB|K|M|G|B)?$", size_str)
-        if not match:
-            return float("inf")
-
-        number = float(match.group(1))
-        unit = match.group(2) or "B"
-
-        # Convert to bytes based on unit
-        multipliers = {
-            "B": 1,
-            "K": 1024,
-            "KB": 1024,
-            "M": 1024 * 1024,
-            "MB": 1024 * 1024,
-            "G": 1024 * 1024 * 1024,
-            "GB": 1024 * 1024 * 1024,
-        }
-
-        return int(number * multipliers.get(unit, 1))
+        return _parse_size_str(size_str)
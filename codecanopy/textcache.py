@@ -0,0 +1,101 @@
+"""Persistent text/binary classification cache.
+
+The documented workflow is running codecanopy repeatedly while
+iterating on a codebase, which re-sniffs the same files every time.
+Classifications are remembered in a small sqlite database under the
+user cache directory, keyed on (path, mtime_ns, size) so any change to
+a file invalidates its entry. Everything fails soft: if the database
+cannot be created or read (read-only home, concurrent locking, ...),
+callers just sniff as if there were no cache.
+"""
+
+import os
+import sqlite3
+import threading
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS text_files ("
+    "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, is_text INTEGER)"
+)
+
+
+def _default_db_path() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "codecanopy", "text-classify.db")
+
+
+class TextCache:
+    """sqlite-backed (path, mtime, size) -> is_text cache.
+
+    Connections are per-thread (sqlite3 objects must not cross threads)
+    and the database runs in WAL mode so the cat thread pool can read
+    and write concurrently.
+    """
+
+    def __init__(self, db_path: str = None):
+        self._db_path = db_path or _default_db_path()
+        self._local = threading.local()
+        self._failed = False
+
+    def _conn(self):
+        if self._failed:
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            try:
+                os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+                conn = sqlite3.connect(self._db_path, timeout=1.0)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(_SCHEMA)
+                self._local.conn = conn
+            except (sqlite3.Error, OSError):
+                self._failed = True
+                return None
+        return conn
+
+    def get(self, path: str, mtime_ns: int, size: int):
+        """Return the cached classification, or None on miss/staleness."""
+        conn = self._conn()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT mtime, size, is_text FROM text_files WHERE path = ?",
+                (path,),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is not None and row[0] == mtime_ns and row[1] == size:
+            return bool(row[2])
+        return None
+
+    def put(self, path: str, mtime_ns: int, size: int, is_text: bool):
+        """Record a classification; silently dropped on database errors."""
+        conn = self._conn()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO text_files VALUES (?, ?, ?, ?)",
+                (path, mtime_ns, size, int(is_text)),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> TextCache:
+    """Return the process-wide cache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = TextCache()
+    return _default_cache
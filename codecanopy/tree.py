@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set
 
 from .config import Config
-from .utils import should_ignore
+from .utils import build_ignore_spec, should_ignore
 
 
 class TreeGenerator:
@@ -13,6 +13,8 @@ class TreeGenerator:
 
     def __init__(self, config: Config):
         self.config = config
+        self._resolve_cache = {}
+        self._focus_strs = []
 
     def generate(
         self,
@@ -42,119 +44,154 @@ class TreeGenerator:
             if focus_path.exists() and focus_path.is_dir():
                 focus_paths.add(focus_path.resolve())
 
+        # Per-run caches: each directory is resolve()d at most once, and the
+        # focus set is flattened to strings for prefix comparisons
+        self._resolve_cache = {}
+        self._focus_strs = [str(fp) for fp in focus_paths]
+
         lines = []
         lines.append(f"{root_path.name}/")
 
-        self._generate_tree_recursive(
+        self._generate_tree(
             root_path,
             lines,
-            "",
-            focus_paths,
             ignore_patterns,
             global_depth,
             show_files,
-            current_depth=0,
         )
 
         return "\n".join(lines)
 
-    def _generate_tree_recursive(
+    def _generate_tree(
         self,
-        path: Path,
+        root_path: Path,
         lines: List[str],
-        prefix: str,
-        focus_paths: Set[Path],
         ignore_patterns: List[str],
         global_depth: int,
         show_files: bool,
-        current_depth: int = 0,
     ):
-        """Recursively generate tree structure."""
-
-        # Determine depth limit for this path
-        path_resolved = path.resolve()
-        is_focused = self._is_path_focused(path_resolved, focus_paths)
-
-        if is_focused:
-            depth_limit = float("inf")  # No limit for focused directories
-        else:
-            depth_limit = global_depth
-
-        if current_depth >= depth_limit:
-            return
-
-        try:
-            entries = list(path.iterdir())
-        except (PermissionError, OSError):
-            return
-
-        # Filter out ignored entries
-        filtered_entries = []
-        for entry in entries:
-            if not should_ignore(entry, ignore_patterns):
-                filtered_entries.append(entry)
-
-        # Separate directories and files
-        directories = [entry for entry in filtered_entries if entry.is_dir()]
-        files = (
-            [entry for entry in filtered_entries if entry.is_file()]
-            if show_files
-            else []
-        )
+        """Generate the tree with an explicit stack instead of recursion.
+
+        Each stack item is (path, prefix, depth, pending_line): the entry's
+        display line is emitted when the item is popped, then the directory
+        contents (if any) are pushed in reverse so the depth-first output
+        order matches the recursive version. File items carry path=None.
+        Deep trees cost no interpreter frames and cannot hit the recursion
+        limit.
+        """
+        # One compiled spec and one getcwd serve every should_ignore
+        # call in the walk
+        ignore_spec = build_ignore_spec(ignore_patterns)
+        cwd = os.getcwd()
+
+        stack = [(root_path, "", 0, None)]
 
-        # Sort entries
-        directories.sort(key=lambda x: x.name.lower())
-        files.sort(key=lambda x: x.name.lower())
+        while stack:
+            path, prefix, current_depth, pending_line = stack.pop()
 
-        all_entries = directories + files
+            if pending_line is not None:
+                lines.append(pending_line)
 
-        for i, entry in enumerate(all_entries):
-            is_last_entry = i == len(all_entries) - 1
+            if path is None:
+                continue
+
+            # Determine depth limit for this path
+            path_resolved = self._resolve(path)
+            is_focused = self._is_path_focused(path_resolved)
 
-            # Determine the tree symbols
-            if is_last_entry:
-                current_prefix = "└── "
-                next_prefix = prefix + "    "
+            if is_focused:
+                depth_limit = float("inf")  # No limit for focused directories
             else:
-                current_prefix = "├── "
-                next_prefix = prefix + "│   "
-
-            # Add focus indicator
-            focus_indicator = ""
-            if entry.is_dir():
-                entry_resolved = entry.resolve()
-                if self._is_path_focused(entry_resolved, focus_paths):
-                    focus_indicator = "  [focused]"
-                elif current_depth + 1 >= global_depth and not is_focused:
-                    focus_indicator = f"  [depth: {global_depth}]"
-
-            # Add trailing slash for directories
-            entry_display = f"{entry.name}/" if entry.is_dir() else entry.name
-            lines.append(f"{prefix}{current_prefix}{entry_display}{focus_indicator}")
-
-            # Recurse into directories
-            if entry.is_dir():
-                self._generate_tree_recursive(
-                    entry,
-                    lines,
-                    next_prefix,
-                    focus_paths,
-                    ignore_patterns,
-                    global_depth,
-                    show_files,
-                    current_depth + 1,
-                )
-
-    def _is_path_focused(self, path_resolved: Path, focus_paths: Set[Path]) -> bool:
-        """Check if a path is focused or contains a focused path."""
-        for focus_path in focus_paths:
-            # Check if path is exactly a focus path
-            if path_resolved == focus_path:
-                return True
-            # Check if path is a parent of a focus path
+                depth_limit = global_depth
+
+            if current_depth >= depth_limit:
+                continue
+
             try:
-                focus_path.relative_to(path_resolved)
-                return True
-            except ValueError:
+                # scandir's DirEntry objects carry cached type info from the
+                # directory read, so no per-entry stat() is needed below
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except (PermissionError, OSError):
                 continue
+
+            # Filter out ignored entries
+            filtered_entries = []
+            for entry in entries:
+                if not should_ignore(entry, ignore_patterns, spec=ignore_spec, cwd=cwd):
+                    filtered_entries.append(entry)
+
+            # Separate directories and files
+            directories = [
+                entry
+                for entry in filtered_entries
+                if entry.is_dir(follow_symlinks=False)
+            ]
+            files = (
+                [
+                    entry
+                    for entry in filtered_entries
+                    if entry.is_file(follow_symlinks=False)
+                ]
+                if show_files
+                else []
+            )
+
+            # Sort entries
+            directories.sort(key=lambda x: x.name.lower())
+            files.sort(key=lambda x: x.name.lower())
+
+            all_entries = directories + files
+
+            items = []
+            for i, entry in enumerate(all_entries):
+                is_last_entry = i == len(all_entries) - 1
+                entry_is_dir = entry.is_dir(follow_symlinks=False)
+
+                # Determine the tree symbols
+                if is_last_entry:
+                    current_prefix = "└── "
+                    next_prefix = prefix + "    "
+                else:
+                    current_prefix = "├── "
+                    next_prefix = prefix + "│   "
+
+                # Add focus indicator
+                focus_indicator = ""
+                if entry_is_dir:
+                    entry_resolved = self._resolve(Path(entry.path))
+                    if self._is_path_focused(entry_resolved):
+                        focus_indicator = "  [focused]"
+                    elif current_depth + 1 >= global_depth and not is_focused:
+                        focus_indicator = f"  [depth: {global_depth}]"
+
+                # Add trailing slash for directories
+                entry_display = f"{entry.name}/" if entry_is_dir else entry.name
+                line = f"{prefix}{current_prefix}{entry_display}{focus_indicator}"
+
+                if entry_is_dir:
+                    items.append(
+                        (Path(entry.path), next_prefix, current_depth + 1, line)
+                    )
+                else:
+                    items.append((None, "", 0, line))
+
+            stack.extend(reversed(items))
+
+    def _resolve(self, path: Path) -> Path:
+        """Resolve a path, reusing the per-run cache to avoid repeat syscalls."""
+        resolved = self._resolve_cache.get(path)
+        if resolved is None:
+            resolved = self._resolve_cache[path] = path.resolve()
+        return resolved
+
+    def _is_path_focused(self, path_resolved: Path) -> bool:
+        """Check if a path is focused or contains a focused path."""
+        path_str = str(path_resolved)
+        prefix = path_str + os.sep
+        for focus_str in self._focus_strs:
+            # Exact focus path, or a parent of one (prefix comparison
+            # instead of relative_to's exception-based control flow)
+            if path_str == focus_str or focus_str.startswith(prefix):
+                return True
         return False
@@ -0,0 +1,114 @@
+"""Optional io_uring-backed batch file reader for the cat pipeline.
+
+On Linux with the `liburing` Python bindings installed, whole batches of
+file reads are submitted to the kernel in one io_uring_enter instead of
+one blocking read() round-trip per file. Everything degrades gracefully:
+if the bindings are missing, the kernel is too old, or anything goes
+wrong mid-flight, callers fall back to ordinary blocking I/O.
+"""
+
+import os
+import sys
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# Number of read SQEs submitted per io_uring_enter round-trip
+_BATCH_SIZE = 128
+
+
+class PreloadedFile:
+    """Result of preloading one file: its size and data, or an error."""
+
+    __slots__ = ("size", "data", "error")
+
+    def __init__(self, size=0, data=None, error=None):
+        self.size = size
+        self.data = data
+        self.error = error
+
+
+def available() -> bool:
+    """Check whether the io_uring backend can be used on this system."""
+    return liburing is not None and sys.platform.startswith("linux")
+
+
+def read_files(paths, max_bytes=None):
+    """Read many files via batched io_uring submissions.
+
+    Returns a dict mapping each path to a PreloadedFile. Files larger
+    than max_bytes get their size recorded but no data read. Raises
+    RuntimeError if the ring cannot be set up at all; callers should
+    fall back to blocking I/O in that case.
+    """
+    if not available():
+        raise RuntimeError("io_uring backend is not available")
+
+    results = {}
+    ring = liburing.io_uring()
+    try:
+        liburing.io_uring_queue_init(_BATCH_SIZE, ring, 0)
+    except Exception as e:
+        raise RuntimeError(f"io_uring setup failed: {e}")
+
+    try:
+        # Open and fstat synchronously (cheap metadata work), then batch
+        # the reads - the expensive, latency-bound part - through the
+        # ring. Descriptors are opened and closed per batch, so at most
+        # _BATCH_SIZE are live at once and large runs stay well clear of
+        # the RLIMIT_NOFILE ceiling.
+        paths = list(paths)
+        for start in range(0, len(paths), _BATCH_SIZE):
+            batch = []
+            try:
+                for path in paths[start : start + _BATCH_SIZE]:
+                    try:
+                        fd = os.open(path, os.O_RDONLY)
+                    except OSError as e:
+                        results[path] = PreloadedFile(error=e)
+                        continue
+                    size = os.fstat(fd).st_size
+                    if max_bytes is not None and size > max_bytes:
+                        os.close(fd)
+                        results[path] = PreloadedFile(size=size)
+                        continue
+                    batch.append((path, fd, size))
+
+                if not batch:
+                    continue
+
+                buffers = []
+                for i, (path, fd, size) in enumerate(batch):
+                    buf = bytearray(size)
+                    buffers.append(buf)
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_read(sqe, fd, buf, size, 0)
+                    sqe.user_data = i
+
+                liburing.io_uring_submit(ring)
+
+                completed = 0
+                cqe = liburing.io_uring_cqe()
+                while completed < len(batch):
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    i = cqe.user_data
+                    path, fd, size = batch[i]
+                    if cqe.res < 0:
+                        results[path] = PreloadedFile(
+                            size=size, error=OSError(-cqe.res, os.strerror(-cqe.res))
+                        )
+                    else:
+                        results[path] = PreloadedFile(
+                            size=size, data=bytes(buffers[i][: cqe.res])
+                        )
+                    liburing.io_uring_cqe_seen(ring, cqe)
+                    completed += 1
+            finally:
+                for path, fd, size in batch:
+                    os.close(fd)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+    return results
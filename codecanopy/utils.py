@@ -1,60 +1,127 @@
 """Shared utilities for CodeCanopy."""
 
 import fnmatch
-import glob
+import functools
 import os
+import re
+import string
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Pattern, Set, Tuple
 
 import pathspec
 
-def should_ignore(path: Path, ignore_patterns: List[str]) -> bool:
-    """Check if path should be ignored based on patterns."""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_spec(patterns: Tuple[str, ...]) -> Optional[pathspec.PathSpec]:
+    """Compile ignore patterns into a PathSpec, cached per unique pattern set.
+
+    should_ignore is called once per directory entry during traversal;
+    caching amortizes the regex compilation across the whole walk.
+    """
+    try:
+        return pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    except Exception:
+        # Fallback to simple pattern matching if pathspec fails
+        return None
+
+
+def build_ignore_spec(ignore_patterns: List[str]) -> Optional[pathspec.PathSpec]:
+    """Compile ignore patterns for repeated should_ignore calls.
+
+    Callers checking many entries against the same patterns build the
+    spec once and pass it to should_ignore, skipping even the cache
+    lookup per entry.
+    """
+    if not ignore_patterns:
+        return None
+    return _compiled_spec(tuple(ignore_patterns))
+
+
+# Sentinel distinguishing "no spec supplied" from an explicit None
+_UNSET = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _literal_pattern_sets(patterns: Tuple[str, ...]):
+    """Precompute the literal lookups for should_ignore's fallback branch.
+
+    Returns (trailing-slash names, bare names, '/'-prefixed suffixes) so
+    the simple-pattern checks run as set probes and one tuple endswith.
+    """
+    dir_names = frozenset(p[:-1] for p in patterns if p.endswith("/"))
+    names = frozenset(p for p in patterns if not p.endswith("/"))
+    suffixes = tuple("/" + p for p in names)
+    return dir_names, names, suffixes
+
+
+@functools.lru_cache(maxsize=None)
+def _union_regex(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Compile all fnmatch patterns into one alternation regex, cached."""
+    try:
+        return re.compile(
+            "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns)
+        )
+    except re.error:
+        return None
+
+
+def should_ignore(path, ignore_patterns: List[str], spec=_UNSET, cwd: str = None) -> bool:
+    """Check if path (a Path or os.DirEntry) should be ignored based on patterns.
+
+    Pass spec (from build_ignore_spec) when checking many entries against
+    the same patterns to avoid the per-call compiled-spec lookup, and cwd
+    (an os.getcwd() string) to skip the getcwd syscall per call.
+    """
     if not ignore_patterns:
         return False
 
-    path_str = str(path)
+    if isinstance(path, os.DirEntry):
+        # DirEntry carries name and path as plain strings; no Path allocation
+        path_str = path.path
+    else:
+        path_str = str(path)
     name = path.name
 
-    # Handle relative path from current directory
-    try:
-        relative_path = path.relative_to(Path.cwd())
-        relative_str = str(relative_path)
-    except ValueError:
+    # Relativize against the working directory with a prefix slice
+    if cwd is None:
+        cwd = os.getcwd()
+    if path_str.startswith(cwd + os.sep):
+        relative_str = path_str[len(cwd) + 1 :]
+    else:
         relative_str = path_str
 
-    # Create pathspec object for gitignore-style patterns
-    try:
-        spec = pathspec.PathSpec.from_lines("gitwildmatch", ignore_patterns)
-
-        # Check if path matches any ignore pattern
+    # Check gitignore-style patterns against the cached compiled spec
+    if spec is _UNSET:
+        spec = _compiled_spec(tuple(ignore_patterns))
+    if spec is not None:
         if (
             spec.match_file(path_str)
             or spec.match_file(name)
             or spec.match_file(relative_str)
         ):
             return True
-    except Exception:
-        # Fallback to simple pattern matching if pathspec fails
-        pass
 
-    # Additional simple pattern matching
-    for pattern in ignore_patterns:
-        # Handle different path representations
-        if (
-            fnmatch.fnmatch(name, pattern)
-            or fnmatch.fnmatch(path_str, pattern)
-            or fnmatch.fnmatch(relative_str, pattern)
-        ):
-            return True
+    # Additional simple pattern matching: one union regex covers every
+    # pattern in a single match instead of N fnmatch calls per candidate
+    union = _union_regex(tuple(ignore_patterns))
+    if union is not None and (
+        union.match(name) or union.match(path_str) or union.match(relative_str)
+    ):
+        return True
 
-        # Handle directory patterns (e.g., "node_modules" should match "path/node_modules/")
-        if pattern.endswith("/") and name == pattern[:-1]:
-            return True
-        if not pattern.endswith("/") and (
-            name == pattern or path_str.endswith("/" + pattern)
-        ):
-            return True
+    # Handle directory patterns (e.g., "node_modules" should match "path/node_modules/")
+    # via precomputed literal sets: two frozenset probes plus one tuple
+    # endswith instead of a per-pattern Python loop
+    dir_names, names, suffixes = _literal_pattern_sets(tuple(ignore_patterns))
+    if name in dir_names or name in names:
+        return True
+    if suffixes and path_str.endswith(suffixes):
+        return True
 
     return False
 
@@ -62,54 +129,148 @@ def should_ignore(path: Path, ignore_patterns: List[str]) -> bool:
 def get_file_size(path: Path) -> int:
     """Get file size in bytes."""
     try:
-        return path.stat().st_size
+        # os.path.getsize skips the Path-level stat machinery
+        return os.path.getsize(path)
     except (OSError, AttributeError):
         return 0
 
 
-def format_header(template: str, path: Path, base_path: Path = None) -> str:
-    """Format header template with path information."""
+@functools.lru_cache(maxsize=None)
+def _compiled_header(template: str):
+    """Pre-split a header template into (literal, field) pieces, cached.
+
+    str.format re-parses the template on every call; splitting it once
+    and joining the pieces removes that parse from the per-file loop.
+    Returns None for templates using format specs, conversions or
+    positional fields - those fall back to plain str.format.
+    """
     try:
-        if base_path:
-            relative_path = path.relative_to(base_path)
-        else:
-            relative_path = path
+        pieces = []
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            if spec or conversion or field == "":
+                return None
+            pieces.append((literal, field))
     except ValueError:
-        # If path is not relative to base_path, use absolute path
-        relative_path = path
+        return None
 
-    # Handle parent directory formatting
-    parent_dir = str(relative_path.parent) if relative_path.parent != Path(".") else ""
+    def render(values):
+        parts = []
+        for literal, field in pieces:
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                parts.append(values[field])
+        return "".join(parts)
 
-    return template.format(
-        path=str(relative_path).replace("\\", "/"),  # Normalize path separators
-        filename=path.name,
-        dir=parent_dir.replace("\\", "/") if parent_dir else "",
-    )
+    return render
 
 
-def is_text_file(path: Path, max_check_bytes: int = 8192) -> bool:
-    """Check if file is likely a text file."""
-    try:
-        with open(path, "rb") as f:
-            chunk = f.read(max_check_bytes)
+def format_header(template: str, path: Path, base_path: Path = None, base_str: str = None) -> str:
+    """Format header template with path information.
+
+    Callers formatting many headers against the same base directory can
+    precompute ``base_str = str(base) + os.sep`` once and pass it in,
+    avoiding a Path.relative_to (and its ValueError control flow) per file.
+    """
+    if base_str is None and base_path is not None:
+        base_str = str(base_path) + os.sep
+
+    path_str = str(path)
+    if base_str and path_str.startswith(base_str):
+        relative_str = path_str[len(base_str):]
+    else:
+        # Path is not under base_path; fall back to the full path
+        relative_str = path_str
+
+    if os.sep != "/":
+        relative_str = relative_str.replace(os.sep, "/")
+
+    parent_dir, _, filename = relative_str.rpartition("/")
+
+    values = {
+        "path": relative_str,
+        "filename": filename or relative_str,
+        "dir": parent_dir,
+    }
+    render = _compiled_header(template)
+    if render is not None:
+        return render(values)
+    return template.format(**values)
+
 
-            # Empty file is considered text
-            if not chunk:
-                return True
+# Extensions whose text/binary nature is unambiguous in practice; files
+# carrying one are classified in O(1) without being opened. Anything not
+# listed falls through to the byte scan.
+_KNOWN_TEXT_EXTS = frozenset({
+    ".py", ".pyx", ".js", ".ts", ".tsx", ".jsx", ".md", ".rst", ".txt",
+    ".json", ".yaml", ".yml", ".toml", ".ini", ".cfg", ".c", ".h",
+    ".cpp", ".hpp", ".rs", ".go", ".java", ".kt", ".rb", ".php",
+    ".html", ".css", ".scss", ".sh", ".sql", ".xml", ".csv",
+})
 
-            # Check for null bytes (strong indicator of binary)
-            if b"\0" in chunk:
-                return False
+_KNOWN_BIN_EXTS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".pdf", ".zip", ".tar", ".gz",
+    ".bz2", ".7z", ".exe", ".dll", ".so", ".dylib", ".o", ".a",
+    ".class", ".jar", ".pyc", ".mp3", ".mp4", ".mov", ".woff",
+    ".woff2", ".ttf",
+})
 
-            # Check for high ratio of non-printable characters
-            printable_chars = sum(
-                1 for byte in chunk if 32 <= byte <= 126 or byte in (9, 10, 13)
-            )
-            ratio = printable_chars / len(chunk)
 
-            # If more than 95% printable characters, consider it text
-            return ratio > 0.95
+def classify_by_extension(name: str) -> Optional[bool]:
+    """Classify a filename as text (True) or binary (False) by extension.
 
+    Returns None when the extension is not in either known set and the
+    content needs to be sniffed.
+    """
+    _, dot, ext = name.rpartition(".")
+    if not dot:
+        return None
+    ext = "." + ext.lower()
+    if ext in _KNOWN_TEXT_EXTS:
+        return True
+    if ext in _KNOWN_BIN_EXTS:
+        return False
+    return None
+
+
+# Bytes considered printable text: ASCII 32-126 plus tab/newline/carriage return
+_PRINTABLE_BYTES = bytes(b for b in range(256) if 32 <= b <= 126 or b in (9, 10, 13))
+
+
+def is_text_bytes(chunk: bytes) -> bool:
+    """Check if an already-read probe chunk looks like text."""
+    # Empty file is considered text
+    if not chunk:
+        return True
+
+    # Check for null bytes (strong indicator of binary)
+    if b"\0" in chunk:
+        return False
+
+    # If more than 95% printable characters, consider it text. With
+    # NumPy installed, big probe chunks go through vectorized (SIMD)
+    # byte comparisons; otherwise one C-level translate pass deletes
+    # the printable bytes and counts what remains. Either way no
+    # Python loop touches individual bytes.
+    if numpy is not None and len(chunk) >= 4096:
+        arr = numpy.frombuffer(chunk, dtype=numpy.uint8)
+        printable = (
+            ((arr >= 32) & (arr <= 126)) | (arr == 9) | (arr == 10) | (arr == 13)
+        )
+        return int(printable.sum()) > 0.95 * arr.size
+
+    non_printable = len(chunk.translate(None, _PRINTABLE_BYTES))
+    ratio = (len(chunk) - non_printable) / len(chunk)
+    return ratio > 0.95
+
+
+def is_text_file(path: Path, max_check_bytes: int = 8192) -> bool:
+    """Check if file is likely a text file."""
+    verdict = classify_by_extension(path.name)
+    if verdict is not None:
+        return verdict
+    try:
+        with open(path, "rb") as f:
+            return is_text_bytes(f.read(max_check_bytes))
     except (IOError, OSError, UnicodeDecodeError):
         return False
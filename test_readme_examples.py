@@ -1,36 +1,183 @@
 #!/usr/bin/env python3
 """Test CodeCanopy according to README examples."""
 
+import atexit
+import concurrent.futures
+import contextlib
+import functools
+import io
+import json
 import os
+import shlex
 import tempfile
 import shutil
 import subprocess
 import sys
+import traceback
 from pathlib import Path
 
+from click.testing import CliRunner
+
+from codecanopy.cli import main as cli_main
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# Write SQEs submitted per io_uring round-trip during fixture setup
+_URING_BATCH = 64
+
+
+def _fast_rmtree(path):
+    """Remove a test directory, preferring the C-speed rm on Linux.
+
+    rm -rf walks with large getdents buffers in a tight C loop;
+    anything unexpected falls back to shutil.rmtree.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            subprocess.run(["rm", "-rf", str(path)], check=True)
+            return
+        except (OSError, subprocess.SubprocessError):
+            pass
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _count_tree(root):
+    """Count all entries under root with one scandir per directory.
+
+    os.scandir returns the entry type straight from getdents64, so the
+    walk makes one syscall per directory instead of a stat per entry the
+    way Path.iterdir or glob would.
+    """
+    count = 0
+    stack = [str(root)]
+    while stack:
+        for entry in os.scandir(stack.pop()):
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            count += 1
+    return count
+
+
+@functools.lru_cache(maxsize=1)
+def _get_template_project():
+    """Build the pristine test project once per session.
+
+    Every test clones from this template instead of re-creating ~20
+    directories and files (and deleting them) per test function. The
+    template itself is removed at interpreter exit.
+    """
+    test_dir = _build_test_project()
+    atexit.register(_fast_rmtree, test_dir)
+    return test_dir
+
 
 def create_test_project():
-    """Create a comprehensive test project structure matching README examples."""
+    """Clone the session template into a fresh directory for one test.
+
+    Hardlink cloning (copy_function=os.link) shares content inodes with
+    the template, so only directory entries are created - no file bytes
+    are copied. Tests may add files (e.g. .codecanopy.json) freely; on
+    filesystems without hardlink support this falls back to a real copy.
+    """
+    template = _get_template_project()
     test_dir = Path(tempfile.mkdtemp(prefix="codecanopy_readme_test_"))
+    try:
+        shutil.copytree(
+            template, test_dir, symlinks=True, dirs_exist_ok=True,
+            copy_function=os.link,
+        )
+    except OSError:
+        shutil.copytree(template, test_dir, symlinks=True, dirs_exist_ok=True)
+    assert _count_tree(test_dir) == _count_tree(template), (
+        "cloned project does not match the template"
+    )
+    return test_dir
+
+
+def _write_file(path, content):
+    """Create a file with a single open/write/close, no pathlib stat calls."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content if isinstance(content, bytes) else content.encode("utf-8"))
+    finally:
+        os.close(fd)
 
-    # Create React-like project structure
-    (test_dir / "src").mkdir()
-    (test_dir / "src" / "components").mkdir()
-    (test_dir / "src" / "hooks").mkdir()
-    (test_dir / "src" / "utils").mkdir()
-    (test_dir / "src" / "auth").mkdir()
-    (test_dir / "src" / "middleware").mkdir()
-    (test_dir / "tests").mkdir()
-    (test_dir / "tests" / "unit").mkdir()
-    (test_dir / "tests" / "integration").mkdir()
-    (test_dir / "docs").mkdir()
-    (test_dir / "node_modules").mkdir()
-    (test_dir / "dist").mkdir()
-    (test_dir / "build").mkdir()
-    (test_dir / "coverage").mkdir()
-
-    # Create files
-    files = {
+
+def _write_files_uring(items):
+    """Batch the fixture writes through io_uring where available.
+
+    items is a list of (path str, bytes). All writes for a batch go to
+    the kernel in one submission instead of one write syscall per file.
+    Returns False whenever anything is missing or fails, in which case
+    the caller falls back to the plain write loop (files are opened
+    with O_TRUNC, so a partial attempt is harmless).
+    """
+    if liburing is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        ring = liburing.io_uring()
+        liburing.io_uring_queue_init(_URING_BATCH, ring, 0)
+    except Exception:
+        return False
+    try:
+        opened = []
+        try:
+            for path, data in items:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                opened.append((fd, data))
+            for start in range(0, len(opened), _URING_BATCH):
+                batch = opened[start : start + _URING_BATCH]
+                for i, (fd, data) in enumerate(batch):
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_write(sqe, fd, data, len(data), 0)
+                    sqe.user_data = i
+                liburing.io_uring_submit(ring)
+                cqe = liburing.io_uring_cqe()
+                for _ in batch:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    if cqe.res < 0:
+                        return False
+                    liburing.io_uring_cqe_seen(ring, cqe)
+        finally:
+            for fd, _ in opened:
+                os.close(fd)
+        return True
+    except Exception:
+        return False
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+
+# Built once at import: the fixture's biggest write, kept as bytes so it
+# goes straight to the write syscall without a str allocation or encode
+LARGE_BLOB = b"// " + b"x" * 50_000  # 50KB file
+
+# React-like project directories (some stay empty, rest hold the files below)
+_PROJECT_DIRS = (
+    "src/components",
+    "src/hooks",
+    "src/utils",
+    "src/auth",
+    "src/middleware",
+    "tests/unit",
+    "tests/integration",
+    "docs",
+    "node_modules",
+    "dist",
+    "build",
+    "coverage",
+)
+
+
+# Fixture contents, encoded once at import. The template builder, its
+# hardlink clones and any forked test workers all share these bytes
+# instead of rebuilding and re-encoding the dict per call.
+_FIXTURE_FILES = tuple(
+    (path, content if isinstance(content, bytes) else content.encode("utf-8"))
+    for path, content in {
         # React components
         "src/components/Header.js": """import React from 'react';
 
@@ -143,32 +290,218 @@ test('fetchUser returns user data', async () => {
         "build/index.html": "<html><body>Built</body></html>",
         "coverage/lcov.info": "SF:src/index.js",
         # Large file to test size limits
-        "src/large-file.js": "// " + "x" * 50000,  # 50KB file
-    }
+        "src/large-file.js": LARGE_BLOB,
+    }.items()
+)
 
-    for file_path, content in files.items():
-        full_path = test_dir / file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content)
+
+def _build_test_project():
+    """Create a comprehensive test project structure matching README examples."""
+    test_dir = Path(tempfile.mkdtemp(prefix="codecanopy_readme_template_"))
+
+    # Two passes: create each unique directory once, then write the
+    # files, instead of re-running mkdir(parents=True) per file
+    directories = {test_dir / d for d in _PROJECT_DIRS}
+    directories.update((test_dir / p).parent for p, _ in _FIXTURE_FILES)
+    for directory in sorted(directories, key=lambda p: len(p.parts)):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    items = [
+        (str(test_dir / file_path), content)
+        for file_path, content in _FIXTURE_FILES
+    ]
+    if not _write_files_uring(items):
+        for path, data in items:
+            _write_file(path, data)
 
     return test_dir
 
 
+# Config fixture serialized once at import; tests write the bytes as-is
+_CONFIG_JSON = json.dumps(
+    {
+        "ignore": ["node_modules", "dist", "build"],
+        "default_depth": 2,
+        "header_format": "--- {path} ---",
+        "max_file_size": "10KB",
+        "focus_dirs": ["src"],
+    }
+).encode()
+
+# Commands the tests run, split once at import time rather than
+# shlex-parsed per invocation
+CMD_TREE = ("tree",)
+CMD_TREE_FOCUS_IGNORE = ("tree", "--focus", "src", "--ignore", "node_modules,dist")
+CMD_TREE_MULTI_FOCUS = ("tree", "--focus", "src/components,src/hooks", "--depth", "2")
+CMD_TREE_FILES = ("tree", "--files", "--focus", "src")
+CMD_TREE_DEPTH_1 = ("tree", "--depth", "1")
+CMD_CAT_ALL_JS = ("cat", "src/**/*.js")
+CMD_CAT_EXCLUDE_TESTS = ("cat", "src/**/*.js", "--exclude", "**/*.test.js")
+CMD_CAT_CUSTOM_HEADER = ("cat", "src/index.js", "--header", "// File: {path}")
+CMD_CAT_MAX_SIZE = ("cat", "src/**/*.js", "--max-size", "1KB")
+CMD_CAT_INDEX = ("cat", "src/index.js")
+CMD_CAT_COMPONENTS = ("cat", "src/components/**/*.js", "--exclude", "**/*.test.*")
+
+
+# Subprocess-mode launcher, built once. -I isolates the interpreter
+# from env vars and the cwd, so a test_dir containing stray .py files
+# can't shadow imports. The in-process import of codecanopy above has
+# already warmed the filesystem cache and written .pyc files that the
+# subprocesses reuse.
+_SUBPROCESS_LAUNCHER = (sys.executable, "-I", "-m", "codecanopy")
+
+# Commands finish well under a second once caches are warm; fail fast
+# instead of hanging for 30s on a wedged invocation
+_SUBPROCESS_TIMEOUT = 5
+
+
 def run_codecanopy_command(cmd, cwd=None):
-    """Run a codecanopy command and return the output."""
+    """Run a codecanopy command and return (stdout, stderr, returncode).
+
+    cmd is a pre-split argument sequence (preferred; see the module
+    constants) or a raw string, which is shlex-split per call. stdout
+    comes back as bytes so assertions compare against pre-encoded
+    needles without decoding kilobytes of output per command; stderr is
+    a str since it only feeds diagnostics. By default the CLI is
+    invoked in-process through click's test runner, skipping an
+    interpreter start plus import per command. Set
+    CODECANOPY_TEST_SUBPROCESS=1 to exercise the real ``python -m
+    codecanopy`` end to end instead.
+    """
+    args = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+
+    if os.environ.get("CODECANOPY_TEST_SUBPROCESS") == "1":
+        try:
+            result = subprocess.run(
+                list(_SUBPROCESS_LAUNCHER) + args,
+                cwd=cwd,
+                capture_output=True,
+                timeout=_SUBPROCESS_TIMEOUT,
+            )
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            return result.stdout, stderr, result.returncode
+        except subprocess.TimeoutExpired:
+            return b"", "Command timed out", 1
+        except Exception as e:
+            return b"", str(e), 1
+
+    old_cwd = os.getcwd()
     try:
-        result = subprocess.run(
-            ["python", "-m", "codecanopy"] + cmd.split(),
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        return result.stdout, result.stderr, result.returncode
-    except subprocess.TimeoutExpired:
-        return "", "Command timed out", 1
-    except Exception as e:
-        return "", str(e), 1
+        if cwd is not None:
+            os.chdir(cwd)
+        result = CliRunner().invoke(cli_main, args)
+        stderr = "" if result.exception is None else repr(result.exception)
+        # stdout_bytes exists across click 8.x; output_bytes only since 8.2
+        return result.stdout_bytes, stderr, result.exit_code
+    finally:
+        os.chdir(old_cwd)
+
+
+# Assertion tables: (description, command, substrings that must appear,
+# substrings that must not). Needles are bytes, encoded once here, so
+# captured stdout is never decoded on the happy path. One loop replaces the per-case
+# run/check/print blocks that used to be copied across test functions.
+_TREE_CASES = (
+    (
+        "codecanopy tree --focus src --ignore node_modules,dist",
+        CMD_TREE_FOCUS_IGNORE,
+        (b"src/", b"components/"),
+        (b"node_modules", b"dist"),
+    ),
+    (
+        "codecanopy tree --focus src/components,src/hooks --depth 2",
+        CMD_TREE_MULTI_FOCUS,
+        (b"src/", b"components/", b"hooks/"),
+        (),
+    ),
+    (
+        "codecanopy tree --files --focus src",
+        CMD_TREE_FILES,
+        (b"Header.js", b"Footer.js"),
+        (),
+    ),
+    (
+        "codecanopy tree --depth 1",
+        CMD_TREE_DEPTH_1,
+        (b"src/",),
+        (b"Header.js",),
+    ),
+)
+
+_CAT_CASES = (
+    (
+        "codecanopy cat 'src/**/*.js'",
+        CMD_CAT_ALL_JS,
+        (b"Header.js", b"Footer.js", b"App.js", b"const Header"),
+        (),
+    ),
+    (
+        "codecanopy cat 'src/**/*.js' --exclude '**/*.test.js'",
+        CMD_CAT_EXCLUDE_TESTS,
+        (b"Header.js",),
+        (b"Header.test.js",),
+    ),
+    (
+        "codecanopy cat 'src/index.js' --header '// File: {path}'",
+        CMD_CAT_CUSTOM_HEADER,
+        (b"// File: src/index.js", b"ReactDOM.render"),
+        (),
+    ),
+    (
+        "codecanopy cat 'src/**/*.js' --max-size 1KB",
+        CMD_CAT_MAX_SIZE,
+        (b"Header.js",),
+        (b"large-file.js",),
+    ),
+)
+
+_CONFIG_CASES = (
+    (
+        "config file loading",
+        CMD_TREE,
+        (b"src/",),
+        (b"node_modules", b"dist"),
+    ),
+    (
+        "custom header format",
+        CMD_CAT_INDEX,
+        (b"--- src/index.js ---",),
+        (),
+    ),
+)
+
+_REAL_WORLD_CASES = (
+    (
+        "Frontend React Project example",
+        CMD_TREE_MULTI_FOCUS,
+        (b"components/", b"hooks/"),
+        (),
+    ),
+    (
+        "component code for LLM review",
+        CMD_CAT_COMPONENTS,
+        (b"Header.js", b"Footer.js"),
+        (b"Header.test.js",),
+    ),
+)
+
+
+def _run_cases(cases, test_dir):
+    """Run a table of (description, command, expected, forbidden) rows."""
+    for number, (description, cmd, expected, forbidden) in enumerate(cases, 1):
+        print(f"\n{number}. Testing: {description}")
+        stdout, stderr, code = run_codecanopy_command(cmd, cwd=test_dir)
+
+        if code != 0:
+            print(f"\u274c Command failed: {stderr}")
+            return False
+        for needle in expected:
+            assert needle in stdout, f"{needle!r} should be in output"
+        for needle in forbidden:
+            assert needle not in stdout, f"{needle!r} should not be in output"
+        print(f"\u2713 {description} works")
+
+    return True
 
 
 def test_tree_examples():
@@ -178,70 +511,9 @@ def test_tree_examples():
     test_dir = create_test_project()
 
     try:
-        # Test 1: Basic tree with focus
-        print("\n1. Testing: codecanopy tree --focus src --ignore node_modules,dist")
-        stdout, stderr, code = run_codecanopy_command(
-            "tree --focus src --ignore node_modules,dist", cwd=test_dir
-        )
-
-        if code == 0:
-            assert "src/" in stdout, "src/ should be in output"
-            assert "components/" in stdout, "components/ should be in output"
-            assert "node_modules" not in stdout, "node_modules should be ignored"
-            assert "dist" not in stdout, "dist should be ignored"
-            print("✓ Basic tree with focus works")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
-
-        # Test 2: Multiple focused directories
-        print(
-            "\n2. Testing: codecanopy tree --focus src/components,src/hooks --depth 2"
-        )
-        stdout, stderr, code = run_codecanopy_command(
-            "tree --focus src/components,src/hooks --depth 2", cwd=test_dir
-        )
-
-        if code == 0:
-            assert "src/" in stdout, "src/ should be in output"
-            assert "components/" in stdout, "components/ should be in output"
-            assert "hooks/" in stdout, "hooks/ should be in output"
-            print("✓ Multiple focused directories work")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
-
-        # Test 3: Show files
-        print("\n3. Testing: codecanopy tree --files --focus src")
-        stdout, stderr, code = run_codecanopy_command(
-            "tree --files --focus src", cwd=test_dir
-        )
-
-        if code == 0:
-            assert "Header.js" in stdout, "Header.js should be shown"
-            assert "Footer.js" in stdout, "Footer.js should be shown"
-            print("✓ Show files works")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
-
-        # Test 4: Custom depth
-        print("\n4. Testing: codecanopy tree --depth 1")
-        stdout, stderr, code = run_codecanopy_command("tree --depth 1", cwd=test_dir)
-
-        if code == 0:
-            assert "src/" in stdout, "src/ should be in output"
-            # Should not show deep files
-            assert "Header.js" not in stdout, "Header.js should not be shown at depth 1"
-            print("✓ Custom depth works")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
-
-        return True
-
+        return _run_cases(_TREE_CASES, test_dir)
     finally:
-        shutil.rmtree(test_dir)
+        _fast_rmtree(test_dir)
 
 
 def test_cat_examples():
@@ -251,66 +523,9 @@ def test_cat_examples():
     test_dir = create_test_project()
 
     try:
-        # Test 1: All JavaScript files
-        print("\n1. Testing: codecanopy cat 'src/**/*.js'")
-        stdout, stderr, code = run_codecanopy_command("cat 'src/**/*.js'", cwd=test_dir)
-
-        if code == 0:
-            assert "Header.js" in stdout, "Header.js should be in output"
-            assert "Footer.js" in stdout, "Footer.js should be in output"
-            assert "App.js" in stdout, "App.js should be in output"
-            assert "const Header" in stdout, "Header component should be in output"
-            print("✓ All JavaScript files work")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
-
-        # Test 2: Exclude test files
-        print("\n2. Testing: codecanopy cat 'src/**/*.js' --exclude '**/*.test.js'")
-        stdout, stderr, code = run_codecanopy_command(
-            "cat 'src/**/*.js' --exclude '**/*.test.js'", cwd=test_dir
-        )
-
-        if code == 0:
-            assert "Header.js" in stdout, "Header.js should be in output"
-            assert "Header.test.js" not in stdout, "Header.test.js should be excluded"
-            print("✓ Exclude patterns work")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
-
-        # Test 3: Custom headers
-        print("\n3. Testing: codecanopy cat 'src/index.js' --header '// File: {path}'")
-        stdout, stderr, code = run_codecanopy_command(
-            "cat 'src/index.js' --header '// File: {path}'", cwd=test_dir
-        )
-
-        if code == 0:
-            assert "// File: src/index.js" in stdout, "Custom header should be present"
-            assert "ReactDOM.render" in stdout, "File content should be present"
-            print("✓ Custom headers work")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
-
-        # Test 4: Size limits
-        print("\n4. Testing: codecanopy cat 'src/**/*.js' --max-size 1KB")
-        stdout, stderr, code = run_codecanopy_command(
-            "cat 'src/**/*.js' --max-size 1KB", cwd=test_dir
-        )
-
-        if code == 0:
-            assert "large-file.js" not in stdout, "Large file should be skipped"
-            assert "Header.js" in stdout, "Small files should still be included"
-            print("✓ Size limits work")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
-
-        return True
-
+        return _run_cases(_CAT_CASES, test_dir)
     finally:
-        shutil.rmtree(test_dir)
+        _fast_rmtree(test_dir)
 
 
 def test_config_examples():
@@ -321,51 +536,11 @@ def test_config_examples():
 
     try:
         # Create config file
-        config_content = {
-            "ignore": ["node_modules", "dist", "build"],
-            "default_depth": 2,
-            "header_format": "--- {path} ---",
-            "max_file_size": "10KB",
-            "focus_dirs": ["src"],
-        }
-
-        config_file = test_dir / ".codecanopy.json"
-        import json
-
-        config_file.write_text(json.dumps(config_content))
-
-        # Test config loading
-        print("\n1. Testing config file loading")
-        stdout, stderr, code = run_codecanopy_command("tree", cwd=test_dir)
-
-        if code == 0:
-            assert "src/" in stdout, "src/ should be in output"
-            assert "node_modules" not in stdout, "node_modules should be ignored"
-            assert "dist" not in stdout, "dist should be ignored"
-            print("✓ Config file loading works")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
-
-        # Test custom header format
-        print("\n2. Testing custom header format")
-        stdout, stderr, code = run_codecanopy_command(
-            "cat 'src/index.js'", cwd=test_dir
-        )
-
-        if code == 0:
-            assert (
-                "--- src/index.js ---" in stdout
-            ), "Custom header format should be used"
-            print("✓ Custom header format works")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
-
-        return True
+        (test_dir / ".codecanopy.json").write_bytes(_CONFIG_JSON)
 
+        return _run_cases(_CONFIG_CASES, test_dir)
     finally:
-        shutil.rmtree(test_dir)
+        _fast_rmtree(test_dir)
 
 
 def test_real_world_examples():
@@ -375,39 +550,34 @@ def test_real_world_examples():
     test_dir = create_test_project()
 
     try:
-        # Frontend React Project example
-        print("\n1. Testing Frontend React Project example")
-        stdout, stderr, code = run_codecanopy_command(
-            "tree --focus src/components,src/hooks --depth 2", cwd=test_dir
-        )
+        return _run_cases(_REAL_WORLD_CASES, test_dir)
+    finally:
+        _fast_rmtree(test_dir)
 
-        if code == 0:
-            assert "components/" in stdout, "components/ should be focused"
-            assert "hooks/" in stdout, "hooks/ should be focused"
-            print("✓ Frontend React Project example works")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
 
-        # Component code for LLM review
-        print("\n2. Testing component code for LLM review")
-        stdout, stderr, code = run_codecanopy_command(
-            "cat 'src/components/**/*.js' --exclude '**/*.test.*'", cwd=test_dir
-        )
+def _run_test_group(func_name):
+    """Run one test group with its prints captured; pool worker entry.
 
-        if code == 0:
-            assert "Header.js" in stdout, "Header.js should be included"
-            assert "Footer.js" in stdout, "Footer.js should be included"
-            assert "Header.test.js" not in stdout, "Test files should be excluded"
-            print("✓ Component code for LLM review works")
-        else:
-            print(f"❌ Command failed: {stderr}")
-            return False
+    Returns (name, passed, captured output) so the parent can emit each
+    group's output as a block instead of interleaving four processes.
+    """
+    func = globals()[func_name]
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            passed = bool(func())
+    except Exception:
+        traceback.print_exc(file=buf)
+        passed = False
+    return func_name, passed, buf.getvalue()
 
-        return True
 
-    finally:
-        shutil.rmtree(test_dir)
+_TEST_GROUPS = (
+    "test_tree_examples",
+    "test_cat_examples",
+    "test_config_examples",
+    "test_real_world_examples",
+)
 
 
 if __name__ == "__main__":
@@ -415,22 +585,19 @@ if __name__ == "__main__":
 
     all_passed = True
 
-    try:
-        all_passed &= test_tree_examples()
-        all_passed &= test_cat_examples()
-        all_passed &= test_config_examples()
-        all_passed &= test_real_world_examples()
-
-        if all_passed:
-            print("\n✅ All README examples work correctly!")
-            print("🎉 CodeCanopy is working as advertised in the README!")
-        else:
-            print("\n❌ Some README examples failed!")
-            sys.exit(1)
-
-    except Exception as e:
-        print(f"\n❌ Test failed with exception: {e}")
-        import traceback
-
-        traceback.print_exc()
+    # The groups are independent (each works in its own tempdir clone),
+    # so they run in parallel worker processes; output prints in the
+    # original group order once each finishes
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=len(_TEST_GROUPS)
+    ) as executor:
+        for name, passed, output in executor.map(_run_test_group, _TEST_GROUPS):
+            sys.stdout.write(output)
+            all_passed &= passed
+
+    if all_passed:
+        print("\n✅ All README examples work correctly!")
+        print("🎉 CodeCanopy is working as advertised in the README!")
+    else:
+        print("\n❌ Some README examples failed!")
         sys.exit(1)